@@ -0,0 +1,78 @@
+"""Load and validate the .env credentials used by mcpnp.py."""
+
+import json
+import os
+import sys
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+# Parsed copy of .env, keyed on its modification time
+ENV_CACHE_NAME = ".env.cache.json"
+
+
+def write_env_cache(env_file, env_stat):
+    """Parse .env and save the result, returning the parsed variables."""
+    # Only imported when the cache is missing or stale
+    from dotenv import dotenv_values
+
+    values = {k: v for k, v in dotenv_values(env_file).items() if v is not None}
+    try:
+        # The cache holds the API secret, so create it readable only by the
+        # owner (mkstemp uses mode 0600) and swap it into place
+        fd, tmp_path = tempfile.mkstemp(dir=env_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"mtime": env_stat.st_mtime, "vars": values}, f)
+            os.replace(tmp_path, env_file.with_name(ENV_CACHE_NAME))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+    return values
+
+
+def _load_env(env_file, env_stat):
+    """Load .env, reusing the parsed cache while it is current."""
+    values = None
+    try:
+        cache = json.loads(env_file.with_name(ENV_CACHE_NAME).read_text())
+        if cache["mtime"] == env_stat.st_mtime:
+            values = cache["vars"]
+    except (OSError, ValueError, KeyError):
+        pass
+    if values is None:
+        values = write_env_cache(env_file, env_stat)
+
+    # Match load_dotenv: never override variables already set
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+
+
+@lru_cache(maxsize=None)
+def validate_and_load(script_dir: Path) -> tuple[str, str]:
+    """Load .env from script_dir and return the API key and secret, exiting if invalid."""
+    env_file = script_dir / ".env"
+    try:
+        env_stat = os.stat(env_file)
+    except FileNotFoundError:
+        print("Error: .env file not found", file=sys.stderr)
+        print("Please create a .env file with your Noun Project API credentials", file=sys.stderr)
+        sys.exit(1)
+
+    # Load environment variables
+    _load_env(env_file, env_stat)
+    api_key = os.environ.get("NOUN_PROJECT_API_KEY")
+    api_secret = os.environ.get("NOUN_PROJECT_API_SECRET")
+
+    if not api_key or api_key == "your_api_key" or not api_secret or api_secret == "your_api_secret":
+        print("Error: Invalid API credentials in .env file", file=sys.stderr)
+        print("Please update your .env file with valid Noun Project API credentials:", file=sys.stderr)
+        print("NOUN_PROJECT_API_KEY=your_actual_api_key", file=sys.stderr)
+        print("NOUN_PROJECT_API_SECRET=your_actual_api_secret", file=sys.stderr)
+        print("\nYou can get API credentials from https://thenounproject.com/developers/", file=sys.stderr)
+        sys.exit(1)
+
+    print("API credentials found in .env file")
+    return api_key, api_secret
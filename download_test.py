@@ -2,16 +2,32 @@
 """Test downloading icons to a directory."""
 
 import asyncio
-import os
+import re
 import traceback
 from pathlib import Path
 import sys
 
+import httpx
+
 # Add the src directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from mcp_noun_project.client import NounProjectClient
 
+# Characters that are not safe to use in a filename
+UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\-_.]')
+
+# Directories already created by this process
+_CREATED_DIRS = set()
+
+
+def ensure_dir(path):
+    """Create a directory (and parents) unless this process already did."""
+    if path in _CREATED_DIRS:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _CREATED_DIRS.add(path)
+
 
 async def test_download(client, icon_id, color=None, size=200):
     """Test the download_icon method directly."""
@@ -55,37 +71,35 @@ async def test_url(client, icon_id, color=None, size=200):
         return None
 
 
-async def download_icon(client, icon_id, output_dir, color=None, size=200):
+async def download_icon(client, http_client, icon_id, output_dir, color=None, size=200):
     """Download an icon to the specified directory."""
     print(f"\nDownloading icon {icon_id} to {output_dir}")
     try:
-        # Get the download URL
-        url = await test_url(client, icon_id, color, size)
+        # Fetch the icon once and take both the URL and the name from it
+        result = await client.get_icon_by_id(icon_id, thumbnail_size=size)
+        icon = result.get("icon", {})
+        url = icon.get("preview_url") or icon.get("thumbnail_url")
         if not url:
             print(f"Failed to get URL for icon {icon_id}")
             return None
         
-        # Get icon details for the filename
-        result = await client.get_icon_by_id(icon_id, thumbnail_size=size)
-        icon = result.get("icon", {})
         icon_name = icon.get("name", f"icon_{icon_id}")
         
         # Create a safe filename
-        import re
-        safe_name = re.sub(r'[^\w\-_.]', '_', icon_name)
+        safe_name = UNSAFE_FILENAME_CHARS.sub('_', icon_name)
         file_path = output_dir / f"{safe_name}_{icon_id}.png"
         
-        # Download the image
-        import httpx
-        async with httpx.AsyncClient() as http_client:
-            print(f"Downloading from URL: {url}")
-            response = await http_client.get(url)
+        # Stream the image straight to disk
+        print(f"Downloading from URL: {url}")
+        async with http_client.stream("GET", url) as response:
             response.raise_for_status()
-            image_data = response.content
-            
-            # Save the image
-            with open(file_path, "wb") as f:
-                f.write(image_data)
+            # Keep blocking file I/O off the event loop so other downloads proceed
+            f = await asyncio.to_thread(open, file_path, "wb")
+            try:
+                async for chunk in response.aiter_bytes(65536):
+                    await asyncio.to_thread(f.write, chunk)
+            finally:
+                await asyncio.to_thread(f.close)
         
         print(f"Successfully downloaded icon to {file_path}")
         return file_path
@@ -100,12 +114,13 @@ async def main():
     """Run tests on the fixed client code."""
     print("=== Testing Noun Project API Client with Fixes ===")
     
+    client = None
     try:
         client = NounProjectClient()
         
         # Create test_icons directory if it doesn't exist
         output_dir = Path(__file__).parent / "test_icons"
-        os.makedirs(output_dir, exist_ok=True)
+        ensure_dir(output_dir)
         
         # Test with a specific icon ID that was failing
         test_icon_id = 5518010  # The one from your error message
@@ -116,28 +131,47 @@ async def main():
         # Test the get_icon_download_url method
         await test_url(client, test_icon_id)
         
-        # Test downloading with the blue color (4169E1)
-        await download_icon(client, test_icon_id, output_dir, color="4169E1", size=400)
-        
-        # Test searching and downloading
-        print("\nTesting search functionality...")
-        search_result = await client.search_icons(query="fitness coach", limit=2)
-        icons = search_result.get("icons", [])
-        
-        if not icons:
-            print("No icons found for 'fitness coach'")
-        else:
-            print(f"Found {len(icons)} icons for 'fitness coach'")
-            for icon in icons:
-                icon_id = icon.get("id")
-                if icon_id:
-                    await download_icon(client, icon_id, output_dir, color="4169E1", size=400)
+        # Share one pooled connection across every icon download
+        async with httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10),
+        ) as http_client:
+            # Test downloading with the blue color (4169E1)
+            await download_icon(
+                client, http_client, test_icon_id, output_dir, color="4169E1", size=400
+            )
+            
+            # Test searching and downloading
+            print("\nTesting search functionality...")
+            search_result = await client.search_icons(query="fitness coach", limit=2)
+            icons = search_result.get("icons", [])
+            
+            if not icons:
+                print("No icons found for 'fitness coach'")
+            else:
+                print(f"Found {len(icons)} icons for 'fitness coach'")
+                # Download the icons concurrently, a few at a time
+                semaphore = asyncio.Semaphore(5)
+
+                async def bounded_download(icon_id):
+                    async with semaphore:
+                        return await download_icon(
+                            client, http_client, icon_id, output_dir, color="4169E1", size=400
+                        )
+
+                await asyncio.gather(
+                    *(bounded_download(icon["id"]) for icon in icons if icon.get("id")),
+                    return_exceptions=True,
+                )
         
         print("\nAll tests completed!")
         
     except Exception as e:
         print(f"Test failed: {str(e)}")
         traceback.print_exc()
+    finally:
+        if client is not None:
+            await client.aclose()
 
 
 if __name__ == "__main__":
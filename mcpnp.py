@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Set up, run, and install the Noun Project MCP server.
+
+Usage: ./mcpnp.py {setup,dev,install}
+"""
+
+import os
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+SERVER_PATH = SCRIPT_DIR / "src" / "mcp_noun_project" / "server.py"
+ENV_FILE = SCRIPT_DIR / ".env"
+
+# Run with the MCP Inspector, pulling in dependencies and this package (editable)
+DEV_CMD = (
+    "mcp", "dev", str(SERVER_PATH),
+    "--with", "httpx", "--with", "h2", "--with", "orjson",
+    "--with", "pybase64", "--with", "python-dotenv",
+    "--with-editable", ".",
+)
+
+# Install in Claude Desktop, passing through the variables from .env
+INSTALL_CMD = (
+    "mcp", "install", str(SERVER_PATH), "--name", "Noun Project",
+    "-f", str(ENV_FILE),
+)
+
+
+def _validate_env():
+    """Check the server file and .env credentials, exiting on any problem."""
+    from _env_check import validate_and_load
+
+    # Verify the server file exists
+    try:
+        os.stat(SERVER_PATH)
+    except FileNotFoundError:
+        print(f"Error: Server file not found at {SERVER_PATH}", file=sys.stderr)
+        sys.exit(1)
+
+    validate_and_load(SCRIPT_DIR)
+
+
+def _exec(cmd):
+    """Replace this process with cmd."""
+    try:
+        os.execvp(cmd[0], cmd)
+    except FileNotFoundError:
+        print(f"Error: {cmd[0]} is not installed or not in your PATH", file=sys.stderr)
+        sys.exit(1)
+
+
+def cmd_setup():
+    """Set up the development environment using uv."""
+    import subprocess
+
+    # Check if uv is installed
+    try:
+        subprocess.run(["uv", "--version"], check=True, stdout=subprocess.PIPE)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        print("Error: uv is not installed or not in your PATH", file=sys.stderr)
+        print("Please install uv from https://github.com/astral-sh/uv", file=sys.stderr)
+        sys.exit(1)
+
+    # Install the package in development mode
+    print("Installing development dependencies...")
+    try:
+        subprocess.run(["uv", "pip", "install", "-e", "."], check=True)
+    except subprocess.CalledProcessError as e:
+        print(f"Error setting up development environment: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print("Development environment setup complete!")
+
+    # Pre-parse the .env file if it is already there
+    from _env_check import write_env_cache
+
+    try:
+        write_env_cache(ENV_FILE, os.stat(ENV_FILE))
+    except FileNotFoundError:
+        pass
+
+    print()
+    print("Next steps:")
+    print("1. Edit the .env file to add your Noun Project API credentials")
+    print("2. Run ./mcpnp.py dev to start the server in development mode")
+    print("3. Run ./mcpnp.py install to install the server in Claude Desktop")
+
+
+def cmd_dev():
+    """Run the MCP server in development mode with the MCP Inspector."""
+    _validate_env()
+
+    # Replace this process with the MCP dev server
+    print("Starting MCP server in development mode...", flush=True)
+    _exec(DEV_CMD)
+
+
+def cmd_install():
+    """Install the MCP server in Claude Desktop."""
+    _validate_env()
+
+    # Replace this process with the MCP installer
+    print("Installing Noun Project MCP server in Claude Desktop...", flush=True)
+    _exec(INSTALL_CMD)
+
+
+COMMANDS = {
+    "setup": cmd_setup,
+    "dev": cmd_dev,
+    "install": cmd_install,
+}
+
+
+def main():
+    """Dispatch to the subcommand named on the command line."""
+    if len(sys.argv) != 2 or sys.argv[1] not in COMMANDS:
+        print(f"Usage: {sys.argv[0]} {{{','.join(COMMANDS)}}}", file=sys.stderr)
+        sys.exit(2)
+
+    COMMANDS[sys.argv[1]]()
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,181 @@
 """Noun Project API client."""
 
-import os
 import asyncio
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urlencode
+import base64
+import hashlib
+import hmac
+import os
+import random
+import secrets
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from urllib.parse import quote
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
-import requests
+import httpx
+import orjson
 from dotenv import load_dotenv
-from requests_oauthlib import OAuth1Session
 
-# Load environment variables from .env file
-load_dotenv()
+# Maximum number of icon lookups (and download URLs) kept in memory
+ICON_CACHE_SIZE = 1024
+
+# Maximum number of search and autocomplete results kept in memory
+SEARCH_CACHE_SIZE = 512
+
+# Seconds before a cached response is fetched again
+ICON_CACHE_TTL = 3600
+SEARCH_CACHE_TTL = 300
+AUTOCOMPLETE_CACHE_TTL = 3600
+
+# Retry policy for failed GET requests
+MAX_RETRIES = 3
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_BACKOFF_BASE = 0.2
+RETRY_BACKOFF_MAX = 4.0
+RETRY_AFTER_MAX = 30.0
+
+
+class Icon(TypedDict, total=False):
+    """An icon record from the Noun Project API (only the fields used here)."""
+
+    id: Union[str, int]
+    name: str
+    preview_url: str
+    thumbnail_url: str
+    attribution: str
+
+
+class Collection(TypedDict, total=False):
+    """A collection record from the Noun Project API (only the fields used here)."""
+
+    id: Union[str, int]
+    name: str
+    icons: List[Icon]
+
+
+class TTLCache:
+    """Size-bounded LRU cache whose entries expire after a fixed number of seconds."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._data.clear()
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given retry attempt."""
+    return random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** attempt))
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying, honoring a numeric Retry-After header."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), RETRY_AFTER_MAX)
+        except ValueError:
+            pass
+    return _backoff_delay(attempt)
+
+
+def _quote(value: str) -> str:
+    """Percent-encode a value as required by the OAuth1 spec (RFC 5849)."""
+    return quote(value, safe="~")
+
+
+@lru_cache(maxsize=1)
+def _load_creds() -> Tuple[str, str]:
+    """Load the API key and secret from the environment or a .env file."""
+    load_dotenv()
+    api_key = os.environ.get("NOUN_PROJECT_API_KEY")
+    api_secret = os.environ.get("NOUN_PROJECT_API_SECRET")
+
+    if not api_key or not api_secret:
+        raise ValueError(
+            "NOUN_PROJECT_API_KEY and NOUN_PROJECT_API_SECRET environment variables must be set"
+        )
+    return api_key, api_secret
+
+
+class OAuth1Auth(httpx.Auth):
+    """Sign httpx requests with two-legged OAuth1 (HMAC-SHA1)."""
+
+    def __init__(self, client_key: str, client_secret: str) -> None:
+        # Both values are fixed for the client's lifetime, so encode them once
+        self._quoted_client_key = _quote(client_key)
+        self._signing_key = f"{_quote(client_secret)}&".encode()
+
+    def _sign(self, method: str, url: httpx.URL) -> str:
+        """Build the OAuth1 Authorization header for a request."""
+        # Every value here is already percent-encoded
+        oauth_params = {
+            "oauth_consumer_key": self._quoted_client_key,
+            "oauth_nonce": secrets.token_hex(16),
+            "oauth_signature_method": "HMAC-SHA1",
+            "oauth_timestamp": str(int(time.time())),
+            "oauth_version": "1.0",
+        }
+
+        # Signature base string: method, base URL and sorted, encoded parameters
+        pairs = sorted(
+            [(_quote(k), _quote(v)) for k, v in url.params.multi_items()]
+            + list(oauth_params.items())
+        )
+        normalized = "&".join(f"{k}={v}" for k, v in pairs)
+        base_url = str(url.copy_with(query=None, fragment=None))
+        base_string = "&".join(
+            (method.upper(), _quote(base_url), _quote(normalized))
+        )
+
+        digest = hmac.new(
+            self._signing_key, base_string.encode(), hashlib.sha1
+        ).digest()
+        oauth_params["oauth_signature"] = _quote(base64.b64encode(digest).decode())
+
+        return "OAuth " + ", ".join(f'{k}="{v}"' for k, v in oauth_params.items())
+
+    def auth_flow(
+        self, request: httpx.Request
+    ) -> Generator[httpx.Request, httpx.Response, None]:
+        """Add the OAuth1 Authorization header to the outgoing request."""
+        request.headers["Authorization"] = self._sign(request.method, request.url)
+        yield request
 
 
 class NounProjectClient:
@@ -18,16 +183,40 @@ class NounProjectClient:
 
     def __init__(self) -> None:
         """Initialize the Noun Project API client."""
-        self.api_key = os.environ.get("NOUN_PROJECT_API_KEY")
-        self.api_secret = os.environ.get("NOUN_PROJECT_API_SECRET")
-        
-        if not self.api_key or not self.api_secret:
-            raise ValueError(
-                "NOUN_PROJECT_API_KEY and NOUN_PROJECT_API_SECRET environment variables must be set"
-            )
+        self.api_key, self.api_secret = _load_creds()
         
         self.base_url = "https://api.thenounproject.com"
-        self.oauth = OAuth1Session(self.api_key, client_secret=self.api_secret)
+
+        # A single pooled client keeps TLS connections alive between API calls
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url,
+            auth=OAuth1Auth(self.api_key, self.api_secret),
+            # Set on the client rather than a custom transport so the proxy
+            # environment variables still apply; _send retries failures
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=16),
+            timeout=httpx.Timeout(10.0),
+        )
+
+        # Keep recent responses so repeat queries do not spend API quota
+        self._icon_cache = TTLCache(ICON_CACHE_SIZE, ICON_CACHE_TTL)
+        self._url_cache = TTLCache(ICON_CACHE_SIZE, ICON_CACHE_TTL)
+        self._search_cache = TTLCache(SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL)
+        self._autocomplete_cache = TTLCache(SEARCH_CACHE_SIZE, AUTOCOMPLETE_CACHE_TTL)
+
+        # GET requests currently awaiting a response, keyed by path and params
+        self._inflight: Dict[tuple, "asyncio.Future[Dict[str, Any]]"] = {}
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._http.aclose()
+
+    def invalidate(self) -> None:
+        """Drop all cached API responses and download URLs."""
+        self._icon_cache.clear()
+        self._url_cache.clear()
+        self._search_cache.clear()
+        self._autocomplete_cache.clear()
 
     async def _request(
         self,
@@ -37,34 +226,57 @@ class NounProjectClient:
         data: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Make a request to the Noun Project API using OAuth1."""
-        url = f"{self.base_url}{path}"
-        
-        # Create a loop to run sync code in async context
-        loop = asyncio.get_running_loop()
-        
-        # Prepare the request with parameters
-        query_string = urlencode(params or {}) if params else ""
-        full_url = f"{url}?{query_string}" if query_string else url
-        
-        # Run the OAuth request in a thread pool
-        if method == "GET":
-            response = await loop.run_in_executor(
-                None, 
-                lambda: self.oauth.get(full_url)
-            )
-        elif method == "POST":
-            response = await loop.run_in_executor(
-                None, 
-                lambda: self.oauth.post(url, params=params, json=data)
-            )
-        else:
+        if method not in ("GET", "POST"):
             raise ValueError(f"Unsupported method: {method}")
+
+        if method != "GET":
+            return await self._send(method, path, params, data)
+
+        # Identical GETs already in flight share a single API call
+        key = (path, tuple(sorted((params or {}).items())))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send(method, path, params, data))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one caller being cancelled does not fail the others
+        return await asyncio.shield(task)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Send a single request and decode its JSON body.
+
+        GET requests are retried with exponential backoff on connection
+        errors, rate limiting (429) and server errors.
+        """
+        retries = MAX_RETRIES if method == "GET" else 0
+        for attempt in range(retries + 1):
+            try:
+                response = await self._http.request(
+                    method, path, params=params, json=data
+                )
+            except httpx.TransportError:
+                if attempt == retries:
+                    raise
+                await asyncio.sleep(_backoff_delay(attempt))
+                continue
+
+            if response.status_code in RETRY_STATUS_CODES and attempt < retries:
+                await asyncio.sleep(_retry_delay(response, attempt))
+                continue
+            break
         
         # Check for errors
         response.raise_for_status()
         
         # Parse and return the JSON response
-        return response.json()
+        return orjson.loads(response.content)
 
     async def search_icons(
         self, 
@@ -75,6 +287,11 @@ class NounProjectClient:
         include_svg: bool = False,
     ) -> Dict[str, Any]:
         """Search for icons by query term."""
+        key = (query, limit, public_domain_only, thumbnail_size, include_svg)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            return cached
+
         params = {
             "query": query,
             "limit": limit,
@@ -89,7 +306,9 @@ class NounProjectClient:
         if include_svg:
             params["include_svg"] = 1
             
-        return await self._request("GET", "/v2/icon", params)
+        result = await self._request("GET", "/v2/icon", params)
+        self._search_cache.set(key, result)
+        return result
 
     async def get_icon_by_id(
         self, 
@@ -97,11 +316,19 @@ class NounProjectClient:
         thumbnail_size: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Get an icon by its ID."""
+        key = (str(icon_id), thumbnail_size)
+        cached = self._icon_cache.get(key)
+        if cached is not None:
+            return cached
+
         params = {}
         if thumbnail_size:
             params["thumbnail_size"] = thumbnail_size
             
-        return await self._request("GET", f"/v2/icon/{icon_id}", params)
+        result = await self._request("GET", f"/v2/icon/{icon_id}", params)
+
+        self._icon_cache.set(key, result)
+        return result
 
     async def download_icon(
         self,
@@ -128,6 +355,11 @@ class NounProjectClient:
         size: Optional[int] = None,
     ) -> str:
         """Get the download URL for an icon."""
+        key = (str(icon_id), size or 200)
+        cached = self._url_cache.get(key)
+        if cached is not None:
+            return cached
+
         result = await self.get_icon_by_id(icon_id, thumbnail_size=size or 200)
         if not result:
             raise ValueError(f"Failed to get icon with ID {icon_id}")
@@ -150,6 +382,7 @@ class NounProjectClient:
         if not preview_url:
             raise ValueError(f"No preview URL found for icon {icon_id}")
             
+        self._url_cache.set(key, preview_url)
         return preview_url
 
     async def get_collections(
@@ -191,13 +424,20 @@ class NounProjectClient:
         limit: int = 10,
     ) -> Dict[str, Any]:
         """Get autocomplete suggestions for a query."""
+        key = (query, limit)
+        cached = self._autocomplete_cache.get(key)
+        if cached is not None:
+            return cached
+
         params = {
             "query": query,
             "limit": limit,
         }
         
-        return await self._request("GET", "/v2/icon/autocomplete", params)
+        result = await self._request("GET", "/v2/icon/autocomplete", params)
+        self._autocomplete_cache.set(key, result)
+        return result
 
     async def get_usage(self) -> Dict[str, Any]:
         """Get API usage information."""
-        return await self._request("GET", "/v2/client/usage", {})
\ No newline at end of file
+        return await self._request("GET", "/v2/client/usage")
\ No newline at end of file
@@ -2,33 +2,430 @@
 
 import asyncio
 import os
+import re
 import sys
+import tempfile
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any, AsyncIterator, Dict, List, Optional, Union
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
+import httpx
+import orjson
+import pybase64
 from dotenv import load_dotenv
 from mcp.server.fastmcp import Context, FastMCP, Image
 from mcp.types import ImageContent, TextContent
 
 try:
-    from mcp_noun_project.client import NounProjectClient
+    from mcp_noun_project.client import (
+        MAX_RETRIES,
+        RETRY_STATUS_CODES,
+        Collection,
+        Icon,
+        NounProjectClient,
+        _backoff_delay,
+        _retry_delay,
+    )
 except ImportError:
     # For direct execution during development
     import sys
     import os
     sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-    from src.mcp_noun_project.client import NounProjectClient
+    from src.mcp_noun_project.client import (
+        MAX_RETRIES,
+        RETRY_STATUS_CODES,
+        Collection,
+        Icon,
+        NounProjectClient,
+        _backoff_delay,
+        _retry_delay,
+    )
+
+T = TypeVar("T")
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Maximum number of icons search_and_download_icons fetches at the same time
+MAX_CONCURRENT_DOWNLOADS = 8
+
+# Characters that are not safe to use in a filename
+_SAFE_NAME_RE = re.compile(r'[^\w\-_.]')
+
+# First and last bytes of every complete PNG file (signature and IEND chunk)
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_END = b"\x00\x00\x00\x00IEND\xaeB`\x82"
+
+# Icon fields returned by search_icons and get_collection_by_id unless the
+# full records are requested with include_svg
+_ICON_KEEP_KEYS = ("id", "name", "thumbnail_url", "preview_url", "attribution")
+
+# Permissions for saved icon files, as open() would create them. mkstemp
+# makes files private, so this is applied before they are moved into place
+_umask = os.umask(0)
+os.umask(_umask)
+OUTPUT_FILE_MODE = 0o666 & ~_umask
+
+# Directory where downloaded icon images are kept between runs
+ICON_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "mcp-noun-project",
+)
+
+# Maximum number of images kept in the icon cache before the least recently
+# used ones are deleted
+ICON_CACHE_MAX_ENTRIES = 2048
+
+
+class IconFileCache:
+    """On-disk LRU cache of icon images keyed by (icon_id, color, size).
+
+    An icon's image never changes for a given id, color and size, so entries
+    do not expire. Each entry is a single file, written atomically, whose
+    modification time is refreshed on every hit. Once there are more than
+    max_entries files, the least recently used are deleted.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path] = ICON_CACHE_DIR,
+        max_entries: int = ICON_CACHE_MAX_ENTRIES,
+    ):
+        self.directory = os.fspath(directory)
+        self.max_entries = max_entries
+        # Number of cached files, counted on the first store
+        self._entries: Optional[int] = None
+
+    def path(self, icon_id: Union[str, int], color: Optional[str], size: int) -> str:
+        """Return the file that holds the cached image for an icon."""
+        name = _SAFE_NAME_RE.sub("_", f"{icon_id}_{color or 'default'}_{size}")
+        return os.path.join(self.directory, f"{name}.png")
+
+    def _get(self, path: str) -> Optional[bytes]:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        try:
+            # Mark the entry as recently used
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def _images(self) -> List[os.DirEntry]:
+        try:
+            with os.scandir(self.directory) as entries:
+                return [
+                    entry
+                    for entry in entries
+                    if entry.name.endswith(".png") and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []
+
+    def _store(self, path: str, data: Union[bytes, bytearray]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            # Replacing an existing entry does not add to the count
+            is_new = not os.path.exists(path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        if self._entries is None:
+            self._entries = len(self._images())
+        elif is_new:
+            self._entries += 1
+        if self._entries > self.max_entries:
+            self._prune()
+
+    def _prune(self) -> None:
+        """Delete the least recently used images, leaving 90% of max_entries."""
+        images = sorted(self._images(), key=lambda entry: entry.stat().st_mtime)
+        excess = max(len(images) - self.max_entries * 9 // 10, 0)
+        for entry in images[:excess]:
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+        self._entries = len(images) - excess
+
+    def _clear(self) -> int:
+        removed = 0
+        try:
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return 0
+        for entry in entries:
+            if entry.name.endswith((".png", ".tmp")) and entry.is_file():
+                os.unlink(entry.path)
+                removed += 1
+        self._entries = 0
+        return removed
+
+    async def get(
+        self, icon_id: Union[str, int], color: Optional[str], size: int
+    ) -> Optional[bytes]:
+        """Return the cached image bytes for an icon, or None on a miss."""
+        return await asyncio.to_thread(self._get, self.path(icon_id, color, size))
+
+    async def set(
+        self,
+        icon_id: Union[str, int],
+        color: Optional[str],
+        size: int,
+        data: Union[bytes, bytearray],
+    ) -> None:
+        """Store the image bytes for an icon."""
+        path = self.path(icon_id, color, size)
+        await asyncio.to_thread(self._store, path, data)
+
+    async def clear(self) -> int:
+        """Remove every cached image, returning how many were removed."""
+        return await asyncio.to_thread(self._clear)
+
 
 @dataclass
 class ServerContext:
     """Server context for the Noun Project API client."""
 
     client: NounProjectClient
+    http: httpx.AsyncClient
+    icon_cache: IconFileCache
+
+
+def _icon_file_name(icon_name: str, icon_id: Union[str, int]) -> str:
+    """Build a filesystem-safe PNG filename for an icon."""
+    return f"{_SAFE_NAME_RE.sub('_', icon_name)}_{icon_id}.png"
+
+
+# Output directories this process has already created
+_KNOWN_DIRS: Set[str] = set()
+
+
+async def _ensure_dir(path: Union[str, Path], recreate: bool = False) -> None:
+    """Create a directory and its parents, once per process.
+
+    Pass recreate=True after finding that a directory created earlier has
+    since been removed.
+    """
+    path = os.path.normpath(os.fspath(path))
+    if recreate or path not in _KNOWN_DIRS:
+        await asyncio.to_thread(os.makedirs, path, exist_ok=True)
+        _KNOWN_DIRS.add(path)
+
+
+async def _write_file(file_path: Path, data: Union[bytes, bytearray]) -> None:
+    """Write a file, recreating its directory if it was removed meanwhile."""
+    try:
+        await asyncio.to_thread(file_path.write_bytes, data)
+    except FileNotFoundError:
+        await _ensure_dir(file_path.parent, recreate=True)
+        await asyncio.to_thread(file_path.write_bytes, data)
+
+
+def _prune_icons(icons: List[Icon]) -> List[Icon]:
+    """Keep only the commonly used fields of each icon record."""
+    return [{k: icon[k] for k in _ICON_KEEP_KEYS if k in icon} for icon in icons]
+
+
+def _json_content(value: Any) -> TextContent:
+    """Serialize a tool result with orjson instead of FastMCP's json.dumps."""
+    return TextContent(type="text", text=orjson.dumps(value).decode())
+
+
+def _existing_files(directory: str) -> Set[str]:
+    """Return the names of the files in a directory."""
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries if entry.is_file()}
+
+
+def _is_complete_png(path: str) -> bool:
+    """Check that a file starts with the PNG signature and ends with IEND.
+
+    Catches empty and truncated images, e.g. from an interrupted copy.
+    """
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(_PNG_SIGNATURE)) != _PNG_SIGNATURE:
+                return False
+            f.seek(-len(_PNG_END), os.SEEK_END)
+            return f.read() == _PNG_END
+    except OSError:
+        return False
+
+
+def _ctx_clients(ctx: Context) -> Tuple[NounProjectClient, httpx.AsyncClient]:
+    """Return the API client and the shared CDN client for a tool call."""
+    lifespan_context = ctx.request_context.lifespan_context
+    return lifespan_context.client, lifespan_context.http
+
+
+def _ctx_icon_cache(ctx: Context) -> IconFileCache:
+    """Return the on-disk icon image cache for a tool call."""
+    return ctx.request_context.lifespan_context.icon_cache
+
+
+def _body_chunks(response: httpx.Response) -> AsyncIterator[bytes]:
+    """Iterate over a streamed response body in 64 KiB chunks."""
+    # Images are normally sent unencoded, so the raw body can be used as-is;
+    # only go through the decoder when a Content-Encoding is set
+    if "Content-Encoding" in response.headers:
+        return response.aiter_bytes(65536)
+    return response.aiter_raw(65536)
+
+
+async def _stream_icon(
+    http: httpx.AsyncClient,
+    icon_url: str,
+    consume: Callable[[httpx.Response], Awaitable[T]],
+) -> T:
+    """GET an icon image and hand the streamed response to consume.
+
+    Like the API client, this retries connection errors, dropped streams,
+    rate limiting (429) and server errors with backoff. consume starts over
+    on every attempt.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            async with http.stream("GET", icon_url) as response:
+                if response.status_code in RETRY_STATUS_CODES and attempt < MAX_RETRIES:
+                    delay = _retry_delay(response, attempt)
+                else:
+                    response.raise_for_status()
+                    return await consume(response)
+        except httpx.TransportError:
+            if attempt == MAX_RETRIES:
+                raise
+            delay = _backoff_delay(attempt)
+        await asyncio.sleep(delay)
+
+
+async def _fetch_icon_bytes(http: httpx.AsyncClient, icon_url: str) -> bytearray:
+    """Download an icon image into a single buffer and return it."""
+
+    async def read(response: httpx.Response) -> bytearray:
+        buffer = bytearray()
+        async for chunk in _body_chunks(response):
+            buffer += chunk
+        return buffer
+
+    return await _stream_icon(http, icon_url, read)
+
+
+async def _download_to_file(
+    http: httpx.AsyncClient, icon_url: str, file_path: Union[str, Path]
+) -> None:
+    """Stream an icon image to a file without blocking the event loop.
+
+    The image is written to a temporary file next to file_path and moved into
+    place once complete, so a failed download never leaves a partial file.
+
+    Raises OSError if the file cannot be written and httpx.HTTPError if the
+    download fails.
+    """
+    directory, name = os.path.split(os.fspath(file_path))
+
+    async def write(response: httpx.Response) -> None:
+        try:
+            fd, tmp_path = await asyncio.to_thread(
+                tempfile.mkstemp, dir=directory, prefix=f".{name}.", suffix=".tmp"
+            )
+        except FileNotFoundError:
+            # The directory was removed after _ensure_dir created it
+            await _ensure_dir(directory, recreate=True)
+            fd, tmp_path = await asyncio.to_thread(
+                tempfile.mkstemp, dir=directory, prefix=f".{name}.", suffix=".tmp"
+            )
+        f = os.fdopen(fd, "wb")
+        try:
+            try:
+                async for chunk in _body_chunks(response):
+                    await asyncio.to_thread(f.write, chunk)
+            finally:
+                await asyncio.to_thread(f.close)
+            await asyncio.to_thread(os.chmod, tmp_path, OUTPUT_FILE_MODE)
+            await asyncio.to_thread(os.replace, tmp_path, file_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    await _stream_icon(http, icon_url, write)
+
+
+async def _get_icon_bytes(
+    ctx: Context, icon_id: Union[str, int], color: Optional[str], size: int
+) -> Union[bytes, bytearray]:
+    """Return an icon image from the disk cache, downloading it on a miss.
+
+    Failures are reported through ctx.error and raised as ValueError.
+    """
+    client, http = _ctx_clients(ctx)
+    icon_cache = _ctx_icon_cache(ctx)
+    
+    # A cached copy saves both the API call and the download
+    image_data = await icon_cache.get(icon_id, color, size)
+    if image_data is not None:
+        return image_data
+    
+    # Get the icon download URL
+    try:
+        icon_url = await client.get_icon_download_url(
+            icon_id=icon_id,
+            color=color,
+            size=size,
+        )
+    except Exception as e:
+        await ctx.error(f"Failed to get icon URL: {str(e)}")
+        raise ValueError(f"Failed to get download URL for icon {icon_id}: {str(e)}")
+    
+    # Download the image
+    try:
+        image_data = await _fetch_icon_bytes(http, icon_url)
+    except Exception as e:
+        await ctx.error(f"Failed to download icon: {str(e)}")
+        raise ValueError(f"Failed to download icon from URL {icon_url}: {str(e)}")
+    
+    try:
+        await icon_cache.set(icon_id, color, size, image_data)
+    except OSError as e:
+        await ctx.warning(f"Failed to cache icon {icon_id}: {str(e)}")
+    
+    return image_data
+
+
+async def _get_icon_name(ctx: Context, icon_id: Union[str, int], size: int) -> str:
+    """Look up an icon's name, falling back to one built from its ID."""
+    client, _ = _ctx_clients(ctx)
+    try:
+        result = await client.get_icon_by_id(
+            icon_id=icon_id,
+            thumbnail_size=size,
+        )
+    except Exception as e:
+        await ctx.error(f"Failed to get icon details: {str(e)}")
+        raise ValueError(f"Failed to get details for icon {icon_id}: {str(e)}")
+    
+    return result.get("icon", {}).get("name", f"icon_{icon_id}")
 
 
 @asynccontextmanager
@@ -37,7 +434,19 @@ async def lifespan(server: FastMCP) -> AsyncIterator[ServerContext]:
     try:
         # Initialize the Noun Project API client
         client = NounProjectClient()
-        yield ServerContext(client=client)
+
+        try:
+            # Shared pool for fetching icon images from the CDN
+            async with httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                timeout=httpx.Timeout(10.0),
+            ) as http:
+                yield ServerContext(
+                    client=client, http=http, icon_cache=IconFileCache()
+                )
+        finally:
+            await client.aclose()
     except Exception as e:
         print(f"Error initializing Noun Project API client: {e}", file=sys.stderr)
         sys.exit(1)
@@ -48,7 +457,7 @@ mcp = FastMCP(
     "Noun Project",
     description="Search and retrieve icons from The Noun Project",
     lifespan=lifespan,
-    dependencies=["httpx", "python-dotenv"],
+    dependencies=["httpx", "h2", "orjson", "pybase64", "python-dotenv"],
 )
 
 
@@ -60,7 +469,7 @@ async def search_icons(
     thumbnail_size: Optional[int] = 84,
     include_svg: bool = False,
     ctx: Context = None,
-) -> List[Dict[str, Any]]:
+) -> List[TextContent]:
     """
     Search for icons by query term.
 
@@ -69,13 +478,14 @@ async def search_icons(
         limit: Maximum number of results to return (default: 10).
         public_domain_only: Limit results to public domain icons only (default: False).
         thumbnail_size: Size of thumbnails to return (42, 84, or 200) (default: 84).
-        include_svg: Include SVG data in the response (default: False).
+        include_svg: Include SVG data and the full icon records in the response
+            (default: False).
         ctx: MCP context.
 
     Returns:
-        A list of icon objects.
+        A list of icon objects, each serialized as JSON text.
     """
-    client = ctx.request_context.lifespan_context.client
+    client, _ = _ctx_clients(ctx)
     result = await client.search_icons(
         query=query,
         limit=limit,
@@ -84,7 +494,12 @@ async def search_icons(
         include_svg=include_svg,
     )
     
-    return result.get("icons", [])
+    icons = result.get("icons", [])
+    if not include_svg:
+        icons = _prune_icons(icons)
+    
+    # One text item per icon, as FastMCP would produce for a list
+    return [_json_content(icon) for icon in icons]
 
 
 @mcp.tool()
@@ -92,7 +507,7 @@ async def get_icon_by_id(
     icon_id: Union[str, int],
     thumbnail_size: Optional[int] = 84,
     ctx: Context = None,
-) -> Dict[str, Any]:
+) -> Icon:
     """
     Get an icon by its ID.
 
@@ -104,7 +519,7 @@ async def get_icon_by_id(
     Returns:
         The icon object.
     """
-    client = ctx.request_context.lifespan_context.client
+    client, _ = _ctx_clients(ctx)
     result = await client.get_icon_by_id(
         icon_id=icon_id,
         thumbnail_size=thumbnail_size,
@@ -132,47 +547,17 @@ async def download_icon_as_image(
     Returns:
         The icon as an image.
     """
-    import httpx
-    import traceback
+    image_data = await _get_icon_bytes(ctx, icon_id, color, size)
     
-    try:
-        client = ctx.request_context.lifespan_context.client
-        
-        # Get the icon download URL
-        try:
-            icon_url = await client.get_icon_download_url(
-                icon_id=icon_id,
-                color=color,
-                size=size,
-            )
-        except Exception as e:
-            ctx.error(f"Failed to get icon URL: {str(e)}")
-            raise ValueError(f"Failed to get download URL for icon {icon_id}: {str(e)}")
-        
-        # Download the image
-        try:
-            async with httpx.AsyncClient() as http_client:
-                response = await http_client.get(icon_url)
-                response.raise_for_status()
-                image_data = response.content
-        except Exception as e:
-            ctx.error(f"Failed to download icon: {str(e)}")
-            raise ValueError(f"Failed to download icon from URL {icon_url}: {str(e)}")
-        
-        # Return the image as an MCP Image
-        # Convert the binary data to base64 string
-        import base64
-        encoded_data = base64.b64encode(image_data).decode('utf-8')
-        
-        return ImageContent(
-            type="image",
-            data=encoded_data,
-            mimeType="image/png",
-        )
+    # Return the image as an MCP Image
+    # Convert the binary data to base64 string
+    encoded_data = pybase64.b64encode_as_string(memoryview(image_data))
     
-    except Exception as e:
-        ctx.error(f"Error in download_icon_as_image: {str(e)}\n{traceback.format_exc()}")
-        raise
+    return ImageContent(
+        type="image",
+        data=encoded_data,
+        mimeType="image/png",
+    )
 
 
 @mcp.tool()
@@ -180,7 +565,7 @@ async def search_collections(
     query: str,
     limit: int = 10,
     ctx: Context = None,
-) -> List[Dict[str, Any]]:
+) -> List[Collection]:
     """
     Search for collections by query term.
 
@@ -192,7 +577,7 @@ async def search_collections(
     Returns:
         A list of collection objects.
     """
-    client = ctx.request_context.lifespan_context.client
+    client, _ = _ctx_clients(ctx)
     result = await client.get_collections(
         query=query,
         limit=limit,
@@ -208,7 +593,7 @@ async def get_collection_by_id(
     thumbnail_size: Optional[int] = 84,
     include_svg: bool = False,
     ctx: Context = None,
-) -> Dict[str, Any]:
+) -> TextContent:
     """
     Get a collection by its ID.
 
@@ -216,13 +601,14 @@ async def get_collection_by_id(
         collection_id: The ID of the collection to retrieve.
         limit: Maximum number of icon results (default: 10).
         thumbnail_size: Size of thumbnails to return (42, 84, or 200) (default: 84).
-        include_svg: Include SVG data in the response (default: False).
+        include_svg: Include SVG data and the full icon records in the response
+            (default: False).
         ctx: MCP context.
 
     Returns:
-        The collection object with its icons.
+        The collection object with its icons, serialized as JSON text.
     """
-    client = ctx.request_context.lifespan_context.client
+    client, _ = _ctx_clients(ctx)
     result = await client.get_collection_by_id(
         collection_id=collection_id,
         limit=limit,
@@ -230,7 +616,11 @@ async def get_collection_by_id(
         include_svg=include_svg,
     )
     
-    return result.get("collection", {})
+    collection = result.get("collection", {})
+    if not include_svg and "icons" in collection:
+        collection = {**collection, "icons": _prune_icons(collection["icons"])}
+    
+    return _json_content(collection)
 
 
 @mcp.tool()
@@ -250,19 +640,16 @@ async def autocomplete_search(
     Returns:
         A list of suggested search terms.
     """
-    client = ctx.request_context.lifespan_context.client
+    client, _ = _ctx_clients(ctx)
     result = await client.autocomplete(
         query=query,
         limit=limit,
     )
     
-    suggestions = []
-    for suggestion in result.get("suggestions", []):
-        term = suggestion.get("term")
-        if term:
-            suggestions.append(term)
-    
-    return suggestions
+    return [
+        term for suggestion in result.get("suggestions", [])
+        if (term := suggestion.get("term"))
+    ]
 
 
 @mcp.tool()
@@ -286,72 +673,29 @@ async def download_icon_to_file(
     Returns:
         The path to the saved file.
     """
-    import os
-    import httpx
-    import traceback
-    from pathlib import Path
+    image_data = await _get_icon_bytes(ctx, icon_id, color, size)
+    
+    # Determine the output file path
+    output_path = Path(output_path)
+    
+    if await asyncio.to_thread(output_path.is_dir):
+        # If output_path is a directory, create a filename using the icon name.
+        # The name comes from the same icon record as the download URL, so
+        # after a download it is already in the client's cache
+        icon_name = await _get_icon_name(ctx, icon_id, size)
+        file_path = output_path / _icon_file_name(icon_name, icon_id)
+    else:
+        # If output_path is not a directory, use it directly (creating parent dirs if needed)
+        await _ensure_dir(output_path.parent)
+        file_path = output_path
     
     try:
-        client = ctx.request_context.lifespan_context.client
-        
-        # Get the icon download URL
-        try:
-            icon_url = await client.get_icon_download_url(
-                icon_id=icon_id,
-                color=color,
-                size=size,
-            )
-            
-            # Also get the icon details for the name
-            result = await client.get_icon_by_id(
-                icon_id=icon_id,
-                thumbnail_size=size,
-            )
-            icon_data = result.get("icon", {})
-            icon_name = icon_data.get("name", f"icon_{icon_id}")
-            
-        except Exception as e:
-            ctx.error(f"Failed to get icon URL: {str(e)}")
-            raise ValueError(f"Failed to get download URL for icon {icon_id}: {str(e)}")
-        
-        # Sanitize the icon name for use in a filename
-        import re
-        safe_name = re.sub(r'[^\w\-_.]', '_', icon_name)
-        
-        # Determine the output file path
-        output_path = Path(output_path)
-        
-        if output_path.is_dir():
-            # If output_path is a directory, create a filename using the icon name
-            file_path = output_path / f"{safe_name}_{icon_id}.png"
-        else:
-            # If output_path is not a directory, use it directly (creating parent dirs if needed)
-            os.makedirs(output_path.parent, exist_ok=True)
-            file_path = output_path
-        
-        # Download the image
-        try:
-            async with httpx.AsyncClient() as http_client:
-                response = await http_client.get(icon_url)
-                response.raise_for_status()
-                image_data = response.content
-        except Exception as e:
-            ctx.error(f"Failed to download icon: {str(e)}")
-            raise ValueError(f"Failed to download icon from URL {icon_url}: {str(e)}")
-        
-        # Save the image to the file
-        try:
-            with open(file_path, "wb") as f:
-                f.write(image_data)
-        except Exception as e:
-            ctx.error(f"Failed to save icon to file: {str(e)}")
-            raise ValueError(f"Failed to save icon to file {file_path}: {str(e)}")
-        
-        return str(file_path)
+        await _write_file(file_path, image_data)
+    except OSError as e:
+        await ctx.error(f"Failed to save icon to file: {str(e)}")
+        raise ValueError(f"Failed to save icon to file {file_path}: {str(e)}")
     
-    except Exception as e:
-        ctx.error(f"Error in download_icon_to_file: {str(e)}\n{traceback.format_exc()}")
-        raise
+    return str(file_path)
 
 
 @mcp.tool()
@@ -362,6 +706,8 @@ async def search_and_download_icons(
     public_domain_only: bool = False,
     color: Optional[str] = None,
     size: int = 200,
+    verbose: bool = False,
+    skip_existing: bool = False,
     ctx: Context = None,
 ) -> List[str]:
     """
@@ -374,58 +720,77 @@ async def search_and_download_icons(
         public_domain_only: Limit results to public domain icons only (default: False).
         color: Hexadecimal color value (e.g., "FF0000" for red).
         size: Size of the images in pixels (default: 200).
+        verbose: Log every downloaded icon instead of one summary (default: False).
+        skip_existing: Reuse icon files already in output_directory instead of
+            downloading them again. File names do not record color or size, so
+            only use this when repeating a download with the same settings.
+            Incomplete images are always downloaded again (default: False).
         ctx: MCP context.
 
     Returns:
         A list of paths to the saved icon files.
     """
-    import os
-    import httpx
-    import asyncio
-    import traceback
-    from pathlib import Path
-    import re
+    # Ensure the output directory exists
+    output_dir = os.fspath(output_directory)
+    await _ensure_dir(output_dir)
+    
+    # Icons saved by an earlier run can be reused instead of downloaded again
+    if skip_existing:
+        try:
+            existing_files = await asyncio.to_thread(_existing_files, output_dir)
+        except FileNotFoundError:
+            # The directory was removed after _ensure_dir created it
+            await _ensure_dir(output_dir, recreate=True)
+            existing_files = set()
+    else:
+        existing_files = set()
+    
+    # Search for icons
+    client, http = _ctx_clients(ctx)
     
     try:
-        # Ensure the output directory exists
-        output_dir = Path(output_directory)
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Search for icons
-        client = ctx.request_context.lifespan_context.client
-        
+        search_result = await client.search_icons(
+            query=query,
+            limit=limit,
+            public_domain_only=public_domain_only,
+            # Largest of the thumbnail sizes the API accepts (42, 84, 200),
+            # for the thumbnail_url fallback below
+            thumbnail_size=200,
+        )
+    except Exception as e:
+        await ctx.error(f"Failed to search for icons: {str(e)}")
+        raise ValueError(f"Failed to search for icons with query '{query}': {str(e)}")
+    
+    icons = search_result.get("icons", [])
+    if not icons:
+        await ctx.warning(f"No icons found for query '{query}'")
+        return []
+    
+    async def download_one(icon: Icon) -> Optional[str]:
+        """Download a single search result, returning its path or None."""
+        icon_get = icon.get
         try:
-            search_result = await client.search_icons(
-                query=query,
-                limit=limit,
-                public_domain_only=public_domain_only,
-            )
-        except Exception as e:
-            ctx.error(f"Failed to search for icons: {str(e)}")
-            raise ValueError(f"Failed to search for icons with query '{query}': {str(e)}")
-        
-        icons = search_result.get("icons", [])
-        if not icons:
-            ctx.warning(f"No icons found for query '{query}'")
-            return []
-        
-        saved_files = []
-        
-        # Process each icon
-        for icon in icons:
-            try:
-                icon_id = icon.get("id")
-                icon_name = icon.get("name", f"icon_{icon_id}")
-                
-                if not icon_id:
-                    ctx.warning(f"No ID found for icon, skipping")
-                    continue
-                
-                # Sanitize the icon name for use in a filename
-                safe_name = re.sub(r'[^\w\-_.]', '_', icon_name)
-                file_path = output_dir / f"{safe_name}_{icon_id}.png"
-                
-                # Get the icon URL
+            icon_id = icon_get("id")
+            icon_name = icon_get("name", f"icon_{icon_id}")
+            
+            if not icon_id:
+                await ctx.warning("No ID found for icon, skipping")
+                return None
+            
+            file_name = _icon_file_name(icon_name, icon_id)
+            file_path = os.path.join(output_dir, file_name)
+            
+            if file_name in existing_files and await asyncio.to_thread(
+                _is_complete_png, file_path
+            ):
+                if verbose:
+                    await ctx.info(f"Icon {icon_id} already saved to {file_path}")
+                return file_path
+            
+            # Search results usually carry a preview URL already; only look
+            # it up when they don't
+            icon_url = icon_get("preview_url") or icon_get("thumbnail_url")
+            if not icon_url:
                 try:
                     icon_url = await client.get_icon_download_url(
                         icon_id=icon_id,
@@ -433,44 +798,43 @@ async def search_and_download_icons(
                         size=size,
                     )
                 except Exception as e:
-                    ctx.warning(f"Failed to get URL for icon {icon_id}: {str(e)}")
-                    continue
-                
-                # Download the image
-                try:
-                    async with httpx.AsyncClient() as http_client:
-                        response = await http_client.get(icon_url)
-                        response.raise_for_status()
-                        image_data = response.content
-                except Exception as e:
-                    ctx.warning(f"Failed to download icon {icon_id}: {str(e)}")
-                    continue
-                
-                # Save the image to a file
-                try:
-                    with open(file_path, "wb") as f:
-                        f.write(image_data)
-                except Exception as e:
-                    ctx.warning(f"Failed to save icon {icon_id} to file: {str(e)}")
-                    continue
-                
-                saved_files.append(str(file_path))
-                ctx.info(f"Downloaded icon {icon_id} to {file_path}")
-                
-                # Add a small delay between downloads to avoid rate limiting
-                await asyncio.sleep(0.2)
-                
+                    await ctx.warning(f"Failed to get URL for icon {icon_id}: {str(e)}")
+                    return None
+            
+            # Stream the image straight to a file
+            try:
+                await _download_to_file(http, icon_url, file_path)
+            except OSError as e:
+                await ctx.warning(f"Failed to save icon {icon_id} to file: {str(e)}")
+                return None
             except Exception as e:
-                ctx.warning(f"Error processing icon {icon.get('id', 'unknown')}: {str(e)}")
-        
-        if not saved_files:
-            ctx.warning("Failed to download any icons")
-        
-        return saved_files
+                await ctx.warning(f"Failed to download icon {icon_id}: {str(e)}")
+                return None
+            
+            if verbose:
+                await ctx.info(f"Downloaded icon {icon_id} to {file_path}")
+            return file_path
+            
+        except Exception as e:
+            await ctx.warning(f"Error processing icon {icon_get('id', 'unknown')}: {str(e)}")
+            return None
     
-    except Exception as e:
-        ctx.error(f"Error in search_and_download_icons: {str(e)}\n{traceback.format_exc()}")
-        raise
+    # Download the icons concurrently, bounding how many are in flight at once
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+    
+    async def bounded_download(icon: Icon) -> Optional[str]:
+        async with semaphore:
+            return await download_one(icon)
+    
+    results = await asyncio.gather(*(bounded_download(icon) for icon in icons))
+    saved_files = [path for path in results if path]
+    
+    if not saved_files:
+        await ctx.warning("Failed to download any icons")
+    else:
+        await ctx.info(f"Downloaded {len(saved_files)} of {len(icons)} icons to {output_dir}")
+    
+    return saved_files
 
 
 @mcp.tool()
@@ -486,16 +850,52 @@ async def get_api_usage(
     Returns:
         API usage information including limits and current usage.
     """
-    client = ctx.request_context.lifespan_context.client
+    client, _ = _ctx_clients(ctx)
     result = await client.get_usage()
     
     return result.get("usage", {})
 
 
-@mcp.resource("documentation://usage")
-async def get_usage_documentation() -> str:
-    """Get documentation on API usage and rate limits."""
-    return """
+@mcp.tool()
+async def clear_cache(
+    ctx: Context = None,
+) -> str:
+    """
+    Clear cached API responses so the next calls fetch fresh data.
+
+    Args:
+        ctx: MCP context.
+
+    Returns:
+        A confirmation message.
+    """
+    client, _ = _ctx_clients(ctx)
+    client.invalidate()
+    
+    return "Cache cleared"
+
+
+@mcp.tool()
+async def clear_icon_cache(
+    ctx: Context = None,
+) -> str:
+    """
+    Delete the icon images cached on disk by the download tools.
+
+    Args:
+        ctx: MCP context.
+
+    Returns:
+        A confirmation message.
+    """
+    icon_cache = _ctx_icon_cache(ctx)
+    removed = await icon_cache.clear()
+    
+    return f"Removed {removed} cached icons from {icon_cache.directory}"
+
+
+# Text served by the documentation resources
+USAGE_DOCUMENTATION = """
     # The Noun Project API Usage
 
     The Noun Project API has rate limits based on your subscription level.
@@ -513,13 +913,17 @@ async def get_usage_documentation() -> str:
     2. Request only the data you need (limit results to save API calls)
     3. Use thumbnail_size parameter to get appropriately sized images
     4. Specify public_domain_only=True if you need royalty-free icons
+    5. Repeated searches are cached for 5 minutes, and autocomplete queries
+       and icon lookups for 1 hour; cached results do not count against your
+       limits, and clear_cache forces fresh results
+    6. Images fetched by download_icon_as_image and download_icon_to_file are
+       kept in $XDG_CACHE_HOME/mcp-noun-project (~/.cache/mcp-noun-project by
+       default), so fetching the same icon, color and size again is served
+       from disk; only the most recently used images are kept, and
+       clear_icon_cache removes them all
     """
 
-
-@mcp.resource("documentation://getting-started")
-async def get_getting_started_documentation() -> str:
-    """Get documentation on how to use the Noun Project MCP server."""
-    return """
+GETTING_STARTED_DOCUMENTATION = """
     # Getting Started with The Noun Project API
 
     The Noun Project provides access to over 3 million icons created by designers worldwide.
@@ -536,6 +940,8 @@ async def get_getting_started_documentation() -> str:
     - get_collection_by_id: Get details for a specific collection
     - autocomplete_search: Get search term suggestions
     - get_api_usage: Check your API usage and limits
+    - clear_cache: Discard cached results and fetch fresh data
+    - clear_icon_cache: Delete icon images cached on disk
 
     ## Example Usage
 
@@ -566,6 +972,18 @@ async def get_getting_started_documentation() -> str:
     """
 
 
+@mcp.resource("documentation://usage")
+async def get_usage_documentation() -> str:
+    """Get documentation on API usage and rate limits."""
+    return USAGE_DOCUMENTATION
+
+
+@mcp.resource("documentation://getting-started")
+async def get_getting_started_documentation() -> str:
+    """Get documentation on how to use the Noun Project MCP server."""
+    return GETTING_STARTED_DOCUMENTATION
+
+
 if __name__ == "__main__":
     """Run the MCP server directly."""
     mcp.run()
\ No newline at end of file
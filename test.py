@@ -81,18 +81,23 @@ async def test_mcp_server():
         class MockContext:
             def __init__(self):
                 from src.mcp_noun_project.client import NounProjectClient
-                from src.mcp_noun_project.server import ServerContext
+                from src.mcp_noun_project.server import IconFileCache, ServerContext
+                import httpx
                 self.request_context = type('obj', (object,), {
-                    'lifespan_context': ServerContext(client=NounProjectClient())
+                    'lifespan_context': ServerContext(
+                        client=NounProjectClient(),
+                        http=httpx.AsyncClient(),
+                        icon_cache=IconFileCache(),
+                    )
                 })
             
-            def info(self, msg):
+            async def info(self, msg):
                 print(f"INFO: {msg}")
             
-            def warning(self, msg):
+            async def warning(self, msg):
                 print(f"WARNING: {msg}")
             
-            def error(self, msg):
+            async def error(self, msg):
                 print(f"ERROR: {msg}")
         
         # Create a context